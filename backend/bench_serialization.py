@@ -0,0 +1,74 @@
+"""Micro-benchmark for the /api/game-status payload.
+
+Compares the old path (str() per datetime, jsonable_encoder, stdlib json)
+against the orjson path used by json_bytes() in main.py.
+
+    python bench_serialization.py
+"""
+import json
+import timeit
+import uuid
+from datetime import datetime, timedelta
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+PICK_COUNTS = [10, 50, 90]
+ITERATIONS = 5000
+
+
+def build_rows(picks):
+    start = datetime(2025, 1, 1, 18, 0, 0)
+    picked = [
+        (f"Player_{i}", i, start + timedelta(seconds=30 * i, microseconds=i))
+        for i in range(1, picks + 1)
+    ]
+    winners = [(f"Winner_{i}", uuid.uuid4()) for i in range(3)]
+    return picked, winners
+
+
+def encode_before(picked, winners):
+    payload = {
+        "picked_names": [
+            {"name": name, "order": order, "picked_at": str(picked_at)}
+            for name, order, picked_at in picked
+        ],
+        "is_locked": False,
+        "winners": [{"name": name, "ticket_id": str(tid)} for name, tid in winners],
+        "last_pick_time": str(picked[-1][2]) if picked else None,
+    }
+    # Same steps FastAPI's JSONResponse takes for a returned dict
+    return json.dumps(
+        jsonable_encoder(payload),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def encode_after(picked, winners):
+    return orjson.dumps({
+        "picked_names": [
+            {"name": name, "order": order, "picked_at": picked_at}
+            for name, order, picked_at in picked
+        ],
+        "is_locked": False,
+        "winners": [{"name": name, "ticket_id": tid} for name, tid in winners],
+        "last_pick_time": picked[-1][2] if picked else None,
+    })
+
+
+def main():
+    print(f"{'picks':>5} {'before (us)':>12} {'after (us)':>11} {'speedup':>8}")
+    for picks in PICK_COUNTS:
+        picked, winners = build_rows(picks)
+        before = timeit.timeit(lambda: encode_before(picked, winners), number=ITERATIONS)
+        after = timeit.timeit(lambda: encode_after(picked, winners), number=ITERATIONS)
+        before_us = before / ITERATIONS * 1e6
+        after_us = after / ITERATIONS * 1e6
+        print(f"{picks:>5} {before_us:>12.1f} {after_us:>11.1f} {before_us / after_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
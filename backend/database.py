@@ -1,5 +1,5 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 # Railway injects DATABASE_URL automatically
@@ -18,6 +18,16 @@ engine = create_engine(
     pool_pre_ping=True
 )
 
+# Total statements sent to Postgres by this worker, exposed on /api/debug/shared-reads
+query_count = 0
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def count_query(conn, cursor, statement, parameters, context, executemany):
+    global query_count
+    query_count += 1
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
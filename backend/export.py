@@ -0,0 +1,194 @@
+"""Streaming export of a game, live or archived, and archival of finished games.
+
+Rows are read through a server-side cursor and written FETCH_SIZE at a time,
+so memory stays flat however many tickets a game has:
+
+    python export.py > game.ndjson                       # live game, every table
+    python export.py --game-id 3 --table picks --format csv > picks.csv
+    python export.py --archive                           # archive + reset the live game
+"""
+import argparse
+import csv
+import io
+import sys
+
+import orjson
+from sqlalchemy import select, text
+
+from models import (
+    Name, Ticket, ClaimQueue,
+    ArchivedPick, ArchivedRegistration, ArchivedClaim,
+)
+
+TABLES = ["picks", "registrations", "tickets", "claims", "winners"]
+FETCH_SIZE = 1000
+
+
+def export_queries(game_id=None) -> dict:
+    """One SELECT per exported table, for the live game or an archived one"""
+    if game_id is None:
+        return {
+            "picks": select(Name.pick_order, Name.name_text, Name.picked_at)
+                .where(Name.is_picked == True).order_by(Name.pick_order),
+            "registrations": select(Ticket.id.label("ticket_id"), Ticket.player_name, Ticket.assigned_at)
+                .where(Ticket.is_assigned == True).order_by(Ticket.assigned_at),
+            "tickets": select(Ticket.id.label("ticket_id"), Ticket.player_name, Ticket.is_assigned,
+                              Ticket.status, Ticket.grid),
+            "claims": select(ClaimQueue.id.label("claim_id"), ClaimQueue.ticket_id, ClaimQueue.status,
+                             ClaimQueue.is_valid, ClaimQueue.claimed_at, ClaimQueue.verified_at)
+                .order_by(ClaimQueue.id),
+            "winners": select(Ticket.id.label("ticket_id"), Ticket.player_name, Ticket.claimed_at)
+                .where(Ticket.status == 'winner').order_by(Ticket.claimed_at),
+        }
+
+    reg = ArchivedRegistration
+    return {
+        "picks": select(ArchivedPick.pick_order, ArchivedPick.name_text, ArchivedPick.picked_at)
+            .where(ArchivedPick.game_id == game_id).order_by(ArchivedPick.pick_order),
+        "registrations": select(reg.ticket_id, reg.player_name, reg.assigned_at)
+            .where(reg.game_id == game_id).order_by(reg.assigned_at),
+        # Only assigned tickets are archived; unassigned ones stay in the live pool
+        "tickets": select(reg.ticket_id, reg.player_name, reg.status, reg.grid)
+            .where(reg.game_id == game_id),
+        "claims": select(ArchivedClaim.claim_id, ArchivedClaim.ticket_id, ArchivedClaim.status,
+                         ArchivedClaim.is_valid, ArchivedClaim.claimed_at, ArchivedClaim.verified_at)
+            .where(ArchivedClaim.game_id == game_id).order_by(ArchivedClaim.claim_id),
+        "winners": select(reg.ticket_id, reg.player_name, reg.claimed_at)
+            .where(reg.game_id == game_id, reg.status == 'winner').order_by(reg.claimed_at),
+    }
+
+
+def iter_rows(conn, query):
+    # stream_results makes psycopg2 use a named (server-side) cursor
+    result = conn.execution_options(stream_results=True, yield_per=FETCH_SIZE).execute(query)
+    for row in result:
+        yield row._mapping
+
+
+def stream_ndjson(engine, tables=TABLES, game_id=None):
+    """Yields JSON lines, one per row tagged with its table, FETCH_SIZE rows per chunk"""
+    queries = export_queries(game_id)
+    lines = []
+    with engine.connect() as conn:
+        for table in tables:
+            for row in iter_rows(conn, queries[table]):
+                lines.append(orjson.dumps({"type": table, **row}))
+                # StreamingResponse hops to the threadpool per chunk, not per row
+                if len(lines) >= FETCH_SIZE:
+                    yield b"\n".join(lines) + b"\n"
+                    lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def stream_csv(engine, table, game_id=None):
+    """Yields a header line then CSV lines of a single table, FETCH_SIZE rows per chunk"""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+
+    def flush():
+        line = buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+        return line.encode()
+
+    with engine.connect() as conn:
+        query = export_queries(game_id)[table]
+        writer.writerow([c.name for c in query.selected_columns])
+        rows = 0
+        for row in iter_rows(conn, query):
+            writer.writerow([
+                orjson.dumps(v).decode() if isinstance(v, list) else v
+                for v in row.values()
+            ])
+            rows += 1
+            if rows % FETCH_SIZE == 0:
+                yield flush()
+    yield flush()
+
+
+def archive_game(db):
+    """Copy the live game into the history tables and clear its claims.
+
+    Runs in the caller's transaction (a Session or Connection); the caller
+    resets names/tickets and commits. Returns the archived game id, or None
+    if nothing was played.
+    """
+    counts = db.execute(text(
+        "SELECT "
+        "(SELECT COUNT(*) FROM names WHERE is_picked), "
+        "(SELECT COUNT(*) FROM tickets WHERE is_assigned), "
+        "(SELECT COUNT(*) FROM tickets WHERE status = 'winner')"
+    )).fetchone()
+    picks, players, winners = counts
+    if not picks and not players:
+        return None
+
+    game_id = db.execute(text(
+        "INSERT INTO archived_games (archived_at, picks, players, winners) "
+        "VALUES (NOW(), :picks, :players, :winners) RETURNING id"
+    ), {"picks": picks, "players": players, "winners": winners}).scalar()
+
+    params = {"game_id": game_id}
+    db.execute(text(
+        "INSERT INTO archived_picks (game_id, pick_order, name_text, picked_at) "
+        "SELECT :game_id, pick_order, name_text, picked_at FROM names WHERE is_picked"
+    ), params)
+    db.execute(text(
+        "INSERT INTO archived_registrations "
+        "(game_id, ticket_id, player_name, grid, status, assigned_at, claimed_at) "
+        "SELECT :game_id, id, player_name, grid, status, assigned_at, claimed_at "
+        "FROM tickets WHERE is_assigned"
+    ), params)
+    db.execute(text(
+        "INSERT INTO archived_claims "
+        "(game_id, claim_id, ticket_id, status, is_valid, claimed_at, verified_at) "
+        "SELECT :game_id, id, ticket_id, status, is_valid, claimed_at, verified_at FROM claim_queue"
+    ), params)
+    db.execute(text("DELETE FROM claim_queue"))
+    return game_id
+
+
+def reset_live_game(db):
+    """Put names and tickets back to their pre-game state (after archive_game)"""
+    db.execute(text("UPDATE names SET is_picked = false, picked_at = NULL, pick_order = NULL"))
+    db.execute(text(
+        "UPDATE tickets SET is_assigned = false, status = 'active', player_name = NULL, "
+        "assigned_at = NULL, claimed_at = NULL"
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--game-id", type=int, default=None, help="archived game to export (default: live game)")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--table", choices=TABLES, default=None,
+                        help="single table to export (required for csv)")
+    parser.add_argument("--archive", action="store_true",
+                        help="archive the live game into the history tables and reset it")
+    args = parser.parse_args()
+
+    from database import engine
+
+    if args.archive:
+        with engine.begin() as conn:
+            game_id = archive_game(conn)
+            if game_id is not None:
+                reset_live_game(conn)
+        print(f"✅ Archived game {game_id}" if game_id else "Nothing to archive", file=sys.stderr)
+        return
+
+    if args.format == "csv":
+        if not args.table:
+            parser.error("--table is required for csv")
+        chunks = stream_csv(engine, args.table, args.game_id)
+    else:
+        chunks = stream_ndjson(engine, [args.table] if args.table else TABLES, args.game_id)
+
+    out = sys.stdout.buffer
+    for chunk in chunks:
+        out.write(chunk)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+from collections import defaultdict
+from itertools import islice
+
+
+class Leaderboard:
+    """How many names each assigned ticket still needs, bucketed by that count.
+
+    A pick only touches the tickets holding the picked name (found through an
+    inverted index), moving each of them down one bucket, so it costs
+    O(tickets containing the name) instead of re-reading every grid.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.changed = asyncio.Event()
+        self.loop = None
+        self.version = 0
+        self._reset()
+
+    def attach(self, loop):
+        """Remember the event loop streams wait on, so changes from other threads can wake them"""
+        self.loop = loop
+
+    def _reset(self):
+        self.tickets_by_name = defaultdict(set)   # name -> ticket ids holding it
+        self.remaining = {}                       # ticket id -> names not yet picked
+        self.buckets = defaultdict(set)           # names not yet picked -> ticket ids
+        self.players = {}                         # ticket id -> player name
+        self.known_ids = set()                    # str(ticket id), for cheap lookups by the rate limiter
+        self.picked = set()
+        self.last_order = 0
+
+    def rebuild(self, tickets, picks):
+        """Rebuild from (ticket_id, player_name, grid) rows and (name, pick_order) rows"""
+        with self.lock:
+            self._reset()
+            for name, order in picks:
+                self.picked.add(name)
+                self.last_order = max(self.last_order, order or 0)
+            for ticket_id, player_name, grid in tickets:
+                self._add(ticket_id, player_name, grid)
+            self._bump()
+
+    def clear(self):
+        with self.lock:
+            self._reset()
+            self._bump()
+
+    def add_ticket(self, ticket_id, player_name, grid):
+        with self.lock:
+            if ticket_id not in self.remaining:
+                self._add(ticket_id, player_name, grid)
+                self._bump()
+
+    def has_ticket(self, ticket_id: str) -> bool:
+        """Whether ticket_id (as sent by a client) is an assigned ticket we know about"""
+        return ticket_id.lower() in self.known_ids
+
+    def pick(self, name, order) -> bool:
+        """Apply the next pick. Returns False if picks were missed and a sync is needed."""
+        with self.lock:
+            if order != self.last_order + 1 or name in self.picked:
+                return False
+            self.picked.add(name)
+            self.last_order = order
+            for ticket_id in self.tickets_by_name.get(name, ()):
+                left = self.remaining[ticket_id]
+                self._move(ticket_id, left, left - 1)
+            self._bump()
+            return True
+
+    def top(self, n: int) -> dict:
+        with self.lock:
+            leaders = []
+            for left in sorted(self.buckets):
+                for ticket_id in islice(self.buckets[left], n - len(leaders)):
+                    leaders.append({
+                        "ticket_id": ticket_id,
+                        "player_name": self.players[ticket_id],
+                        "remaining": left,
+                    })
+                if len(leaders) >= n:
+                    break
+            return {
+                "version": self.version,
+                "picks": len(self.picked),
+                "tickets": len(self.remaining),
+                "counts": {str(left): len(ids) for left, ids in sorted(self.buckets.items())},
+                "leaders": leaders,
+            }
+
+    def _add(self, ticket_id, player_name, grid):
+        names = {cell for row in grid for cell in row if cell}
+        for name in names:
+            self.tickets_by_name[name].add(ticket_id)
+        left = len(names - self.picked)
+        self.remaining[ticket_id] = left
+        self.buckets[left].add(ticket_id)
+        self.players[ticket_id] = player_name
+        self.known_ids.add(str(ticket_id).lower())
+
+    def _move(self, ticket_id, old, new):
+        bucket = self.buckets[old]
+        bucket.discard(ticket_id)
+        if not bucket:
+            del self.buckets[old]
+        self.buckets[new].add(ticket_id)
+        self.remaining[ticket_id] = new
+
+    def _bump(self):
+        self.version += 1
+        if self.loop is None:
+            return
+        try:
+            on_loop = asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            on_loop = False
+        # asyncio.Event isn't thread-safe: changes from the startup thread or the
+        # threadpool hand the wake-up to the loop instead
+        if on_loop:
+            self._notify()
+        else:
+            self.loop.call_soon_threadsafe(self._notify)
+
+    def _notify(self):
+        # Wake every stream waiting on a change; clearing right away leaves them woken
+        self.changed.set()
+        self.changed.clear()
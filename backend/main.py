@@ -1,14 +1,26 @@
-from fastapi import FastAPI, Depends, HTTPException, Header
+import time
+IMPORT_STARTED = time.perf_counter()
+
+from fastapi import FastAPI, Depends, HTTPException, Header, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, text
 from datetime import datetime
 import os
 import random
 import json
-from database import get_db, engine
-from models import Base, Name, Ticket, GameState, ClaimQueue
+import asyncio
+import orjson
+import database
+from database import get_db, engine, SessionLocal
+from models import Base, Name, Ticket, GameState, ClaimQueue, ArchivedGame
 from tickets import pre_generate_tickets
+from ratelimit import RateLimiter, AdmissionMiddleware, parse_budget, rate_limit_key, too_busy
+from startup import StartupPipeline
+from leaderboard import Leaderboard
+from singleflight import SingleFlight
+from export import TABLES as EXPORT_TABLES, stream_ndjson, stream_csv, archive_game, reset_live_game
 from fastapi.staticfiles import StaticFiles
 import os
 from urllib.parse import unquote
@@ -17,7 +29,42 @@ import unicodedata
 
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# ENV VARS
+ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin123")
+JOIN_URL = os.getenv("JOIN_URL", "https://bingo-frontend-production.up.railway.app/join")
+
+# Rate limits as "requests per second/burst", per ticket id (or IP if none is sent)
+RATE_LIMITS = {
+    "/api/game-status": parse_budget(os.getenv("RATE_LIMIT_GAME_STATUS", "2/10")),
+    "/api/ticket": parse_budget(os.getenv("RATE_LIMIT_TICKET", "1/5")),
+    "/api/claim": parse_budget(os.getenv("RATE_LIMIT_CLAIM", "0.2/3")),
+}
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", 32))
+
+# Shared reads polled by every player are fetched once per burst and reused this long
+SHARED_READ_TTL = float(os.getenv("SHARED_READ_TTL", 0.5))
+
+ADMIN_TOKEN = "admin_authenticated"
+
+limiter = RateLimiter(RATE_LIMITS)
+
+# Assigned tickets, kept in memory; also tells the rate limiter which ticket ids are real
+leaderboard = Leaderboard()
+
+# Admission control sits inside CORS so rejected responses stay readable by the browser.
+# Claims are limited in the route itself, keyed by the ticket id from the body.
+# Probes and long-lived streams are exempt from the in-flight cap.
+app.add_middleware(
+    AdmissionMiddleware,
+    limiter=limiter,
+    routes=["/api/game-status", "/api/ticket"],
+    max_inflight=MAX_CONCURRENT_REQUESTS,
+    is_known_ticket=leaderboard.has_ticket,
+    admin_token=ADMIN_TOKEN,
+    uncapped=["/health", "/ready", "/api/admin/leaderboard/stream", "/api/admin/export"],
+)
 
 # CORS
 app.add_middleware(
@@ -26,12 +73,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After"],
 )
 
-# ENV VARS
-ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin123")
-JOIN_URL = os.getenv("JOIN_URL", "https://bingo-frontend-production.up.railway.app/join")
-
 # After app creation, before routes
 STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
 if not os.path.exists(STATIC_DIR):
@@ -46,6 +90,29 @@ def normalize(s: str) -> str:
         .strip()\
         .lower()
 
+def json_bytes(payload) -> Response:
+    """Encode a payload with orjson and return it as-is, skipping jsonable_encoder.
+
+    orjson handles datetime and UUID natively, so hot routes can hand it
+    ORM values without converting every row to str first.
+    """
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+_profiles_by_name = None
+
+def load_profiles() -> dict:
+    """profiles.json keyed by normalized name, read once and kept for the process lifetime"""
+    global _profiles_by_name
+    if _profiles_by_name is None:
+        PROFILES_FILE = os.path.join(os.path.dirname(__file__), "profiles.json")
+        profiles = {}
+        if os.path.exists(PROFILES_FILE):
+            with open(PROFILES_FILE) as f:
+                for k, v in json.load(f).items():
+                    profiles.setdefault(normalize(k), v)
+        _profiles_by_name = profiles
+    return _profiles_by_name
+
 # -----------------------------
 # BASIC ROUTES
 # -----------------------------
@@ -61,6 +128,11 @@ def debug_photos():
         "files": [f.name for f in base.glob("*")] if base.exists() else []
     }
 
+@app.get("/api/debug/shared-reads")
+def debug_shared_reads():
+    """Executed vs coalesced vs cached fetches per shared read, plus total DB statements"""
+    return {"reads": dict(shared_reads.stats), "db_queries": database.query_count}
+
 @app.get("/api/debug/profiles")
 def debug_profiles():
     PROFILES_FILE = os.path.join(os.path.dirname(__file__), "profiles.json")
@@ -84,6 +156,7 @@ async def root():
 
 @app.get("/health")
 async def health():
+    """Liveness only: never touches the database, see /ready for readiness"""
     return {"status": "healthy", "timestamp": str(datetime.now())}
 
 @app.get("/admin")
@@ -97,6 +170,10 @@ async def admin():
             "/api/admin/claims",
             "/api/admin/verify-claim",
             "/api/admin/reset-game",
+            "/api/admin/games",
+            "/api/admin/export",
+            "/api/admin/leaderboard",
+            "/api/admin/leaderboard/stream",
             "/api/admin/qr-code"
         ]
     }
@@ -111,24 +188,16 @@ async def get_names(db: Session = Depends(get_db)):
 @app.get("/api/profile/{name}")
 async def get_profile(name: str):
     try:
-        PROFILES_FILE = os.path.join(os.path.dirname(__file__), "profiles.json")
-
-        if not os.path.exists(PROFILES_FILE):
-            return {"photo": None, "bio": None, "blur": False}
-
-        with open(PROFILES_FILE) as f:
-            profiles = json.load(f)
-
         target = normalize(unquote(name).strip('"'))
 
         # 🔥 SAFE MATCH (this is the key fix)
-        for k, v in profiles.items():
-            if normalize(k) == target:
-                return {
-                    "photo": v.get("photo"),
-                    "bio": v.get("bio"),
-                    "blur": v.get("blur", False)
-                }
+        v = load_profiles().get(target)
+        if v is not None:
+            return {
+                "photo": v.get("photo"),
+                "bio": v.get("bio"),
+                "blur": v.get("blur", False)
+            }
 
         # no match
         return {"photo": None, "bio": None, "blur": False}
@@ -160,56 +229,85 @@ async def register(data: dict, db: Session = Depends(get_db)):
     ticket.assigned_at = datetime.now()
     db.commit()
     db.refresh(ticket)
+    leaderboard.add_ticket(ticket.id, ticket.player_name, ticket.grid)
 
     return {"ticket_id": str(ticket.id), "grid": ticket.grid, "player_name": ticket.player_name}
 
 
+# Every player polls the same picked names / game status right after a pick, so
+# concurrent identical reads share one fetch (run in the threadpool, own session).
+shared_reads = SingleFlight(ttl=SHARED_READ_TTL)
+
+def fetch_picked_names() -> list:
+    db = SessionLocal()
+    try:
+        return [n[0] for n in db.query(Name.name_text).filter(Name.is_picked == True).all()]
+    finally:
+        db.close()
+
+
+def fetch_game_status() -> bytes:
+    db = SessionLocal()
+    try:
+        picked = db.query(Name).filter(Name.is_picked == True).order_by(Name.pick_order).all()
+
+        picked_names = [
+            {"name": n.name_text, "order": n.pick_order, "picked_at": n.picked_at}
+            for n in picked
+        ]
+
+        lock_state = db.query(GameState).filter(GameState.key == 'claim_lock').first()
+        is_locked = lock_state.value == "true" if lock_state else False
+
+        winners = db.query(Ticket).filter(Ticket.status == 'winner').all()
+        winner_list = [{"name": t.player_name, "ticket_id": t.id} for t in winners]
+
+        last_pick = picked[-1] if picked else None
+
+        # Encoded once here; every coalesced waiter sends the same bytes
+        return orjson.dumps({
+            "picked_names": picked_names,
+            "is_locked": is_locked,
+            "winners": winner_list,
+            "last_pick_time": last_pick.picked_at if last_pick else None
+        })
+    finally:
+        db.close()
+
+
 @app.get("/api/ticket/{ticket_id}")
 async def get_ticket(ticket_id: str, db: Session = Depends(get_db)):
     ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
     if not ticket:
         raise HTTPException(404, "Ticket not found")
 
-    picked_names = [n[0] for n in db.query(Name.name_text).filter(Name.is_picked == True).all()]
+    picked_names = await shared_reads.do("picked_names", fetch_picked_names)
 
-    return {
-        "ticket_id": str(ticket.id),
+    return json_bytes({
+        "ticket_id": ticket.id,
         "player_name": ticket.player_name,
         "grid": ticket.grid,
         "status": ticket.status,
         "picked_names": picked_names
-    }
+    })
 
 
 @app.get("/api/game-status")
-async def game_status(db: Session = Depends(get_db)):
-    picked = db.query(Name).filter(Name.is_picked == True).order_by(Name.pick_order).all()
-
-    picked_names = [
-        {"name": n.name_text, "order": n.pick_order, "picked_at": str(n.picked_at)}
-        for n in picked
-    ]
-
-    lock_state = db.query(GameState).filter(GameState.key == 'claim_lock').first()
-    is_locked = lock_state.value == "true" if lock_state else False
-
-    winners = db.query(Ticket).filter(Ticket.status == 'winner').all()
-    winner_list = [{"name": t.player_name, "ticket_id": str(t.id)} for t in winners]
-
-    last_pick = picked[-1] if picked else None
-
-    return {
-        "picked_names": picked_names,
-        "is_locked": is_locked,
-        "winners": winner_list,
-        "last_pick_time": str(last_pick.picked_at) if last_pick else None
-    }
+async def game_status():
+    body = await shared_reads.do("game_status", fetch_game_status)
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/api/claim")
-async def claim(data: dict, db: Session = Depends(get_db)):
+async def claim(data: dict, request: Request, db: Session = Depends(get_db)):
     ticket_id = data.get("ticket_id")
 
+    # Checked before the first query, so a throttled claim never opens a DB connection
+    client = rate_limit_key(request.scope, str(ticket_id or ""), leaderboard.has_ticket)
+    retry_after = limiter.check("/api/claim", client)
+    if retry_after:
+        return too_busy(429, retry_after, "Too many claim attempts")
+
     lock = db.execute(text("SELECT pg_try_advisory_lock(1) AS got_lock")).fetchone()
     if not lock[0]:
         return {"success": False, "message": "Claim in progress"}
@@ -235,6 +333,7 @@ async def claim(data: dict, db: Session = Depends(get_db)):
             db.add(GameState(key='claim_lock', value='true'))
 
         db.commit()
+        shared_reads.invalidate()
 
         position = db.query(ClaimQueue).filter(ClaimQueue.status == 'pending').count()
         return {"success": True, "queue_position": position}
@@ -250,7 +349,7 @@ async def claim(data: dict, db: Session = Depends(get_db)):
 async def admin_login(data: dict):
     if data.get("password") != ADMIN_PASSWORD:
         raise HTTPException(401, "Invalid password")
-    return {"success": True, "token": "admin_authenticated"}
+    return {"success": True, "token": ADMIN_TOKEN}
 
 
 @app.post("/api/admin/pick-name")
@@ -267,7 +366,9 @@ async def pick_name(authorization: str = Header(None), db: Session = Depends(get
     selected.pick_order = max_order + 1
 
     db.commit()
+    shared_reads.invalidate()
     db.refresh(selected)
+    leaderboard.pick(selected.name_text, selected.pick_order)
 
     remaining = db.query(Name).filter(Name.is_picked == False).count()
 
@@ -327,25 +428,126 @@ async def verify_claim(data: dict, authorization: str = Header(None), db: Sessio
             lock_state.value = "false"
 
     db.commit()
+    shared_reads.invalidate()
 
     return {"success": True, "winner": is_valid}
 
 
 @app.post("/api/admin/reset-game")
 async def reset_game(authorization: str = Header(None), db: Session = Depends(get_db)):
-    db.query(ClaimQueue).delete()
-    db.query(Name).update({
-        Name.is_picked: False,
-        Name.picked_at: None,
-        Name.pick_order: None
-    })
-    db.query(Ticket).update({
-        Ticket.is_assigned: False,
-        Ticket.status: 'active',
-        Ticket.player_name: None
-    })
+    # Move the finished game into the history tables before wiping it
+    game_id = archive_game(db)
+    reset_live_game(db)
     db.commit()
-    return {"success": True}
+    shared_reads.invalidate()
+    leaderboard.clear()
+    return {"success": True, "archived_game_id": game_id}
+
+
+@app.get("/api/admin/games")
+async def archived_games(authorization: str = Header(None), db: Session = Depends(get_db)):
+    games = db.query(ArchivedGame).order_by(ArchivedGame.id.desc()).all()
+    return {"games": [
+        {
+            "game_id": g.id,
+            "archived_at": g.archived_at,
+            "picks": g.picks,
+            "players": g.players,
+            "winners": g.winners
+        }
+        for g in games
+    ]}
+
+
+@app.get("/api/admin/export")
+async def export_game(format: str = "ndjson", table: str = None, game_id: int = None,
+                      authorization: str = Header(None)):
+    """Stream the live game (or archived game_id) as NDJSON, or one table as CSV"""
+    if table is not None and table not in EXPORT_TABLES:
+        raise HTTPException(400, f"table must be one of {', '.join(EXPORT_TABLES)}")
+    filename = f"game-{game_id or 'live'}-{table or 'all'}"
+
+    if format == "csv":
+        if table is None:
+            raise HTTPException(400, "table is required for csv")
+        return StreamingResponse(stream_csv(engine, table, game_id), media_type="text/csv",
+                                 headers={"Content-Disposition": f"attachment; filename={filename}.csv"})
+    if format != "ndjson":
+        raise HTTPException(400, "format must be ndjson or csv")
+
+    tables = [table] if table else EXPORT_TABLES
+    return StreamingResponse(stream_ndjson(engine, tables, game_id), media_type="application/x-ndjson",
+                             headers={"Content-Disposition": f"attachment; filename={filename}.ndjson"})
+
+# -----------------------------
+# NEAR-WIN LEADERBOARD
+# -----------------------------
+
+def sync_leaderboard(db: Session):
+    """Catch the in-process leaderboard up with picks and registrations made by other workers"""
+    picks, last_order = db.query(func.count(Name.id), func.max(Name.pick_order))\
+        .filter(Name.is_picked == True).one()
+    assigned = db.query(func.count(Ticket.id)).filter(Ticket.is_assigned == True).scalar()
+
+    if assigned == len(leaderboard.remaining) and last_order == (leaderboard.last_order or None):
+        return
+
+    if assigned == len(leaderboard.remaining) and picks > len(leaderboard.picked):
+        # Only new picks: apply them incrementally, falling back to a rebuild on a gap
+        new_picks = db.query(Name.name_text, Name.pick_order)\
+            .filter(Name.is_picked == True, Name.pick_order > leaderboard.last_order)\
+            .order_by(Name.pick_order).all()
+        if all(leaderboard.pick(name, order) for name, order in new_picks):
+            return
+
+    tickets = db.query(Ticket.id, Ticket.player_name, Ticket.grid).filter(Ticket.is_assigned == True).all()
+    picked = db.query(Name.name_text, Name.pick_order).filter(Name.is_picked == True).all()
+    leaderboard.rebuild(tickets, picked)
+
+
+def sync_leaderboard_in_own_session():
+    db = SessionLocal()
+    try:
+        sync_leaderboard(db)
+    finally:
+        db.close()
+
+
+# Every open stream and admin request asking for a sync at once shares one
+# run in the threadpool, and a sync is reused for a second, so N streams
+# don't mean N rebuilds on each change.
+leaderboard_syncs = SingleFlight(ttl=1.0)
+
+async def refresh_leaderboard():
+    await leaderboard_syncs.do("leaderboard", sync_leaderboard_in_own_session)
+
+
+@app.get("/api/admin/leaderboard")
+async def get_leaderboard(top: int = Query(10, ge=1, le=1000), authorization: str = Header(None)):
+    await refresh_leaderboard()
+    return leaderboard.top(top)
+
+
+@app.get("/api/admin/leaderboard/stream")
+async def stream_leaderboard(top: int = Query(10, ge=1, le=1000)):
+    """Server-sent events: one "leaderboard" event per change"""
+    async def events():
+        sent_version = None
+        while True:
+            await refresh_leaderboard()
+            if leaderboard.version != sent_version:
+                board = leaderboard.top(top)
+                sent_version = board["version"]
+                yield b"event: leaderboard\ndata: " + orjson.dumps(board) + b"\n\n"
+            # Picks on this worker wake us straight away; the timeout covers other workers
+            try:
+                await asyncio.wait_for(leaderboard.changed.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                pass
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
 
 @app.get("/api/admin/pending-claims")
 async def pending_claims(db: Session = Depends(get_db)):
@@ -401,95 +603,114 @@ async def resolve_claim(data: dict, db: Session = Depends(get_db)):
     lock_state.value = "false"
     
     db.commit()
+    shared_reads.invalidate()
     return {"success": True}
 
 # -----------------------------
-# STARTUP EVENT - Database Initialization
+# STARTUP PIPELINE - Database Initialization
 # -----------------------------
+# Seeding and warm-up run in the background so /health answers as soon as
+# uvicorn binds; /ready only turns green once every step below has finished.
+
+def create_tables():
+    Base.metadata.create_all(bind=engine)
+    print("✅ Database tables created")
+
+
+def seed_names():
+    with engine.begin() as conn:
+        if conn.execute(text("SELECT EXISTS (SELECT 1 FROM names)")).scalar():
+            print("✅ Names already seeded")
+            return
+
+        print("📝 Seeding names table...")
+        BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+        NAMES_FILE = os.path.join(BASE_DIR, "names.json")
+
+        if os.path.exists(NAMES_FILE):
+            with open(NAMES_FILE) as f:
+                names_list = json.load(f)
+            print(f"✅ Loaded {len(names_list)} names from names.json")
+        else:
+            print("⚠️ names.json not found, using defaults")
+            names_list = [f"Player_{i}" for i in range(1, 91)]
+
+        conn.execute(
+            text("INSERT INTO names (name_text, is_picked, pick_order) VALUES (:name, false, NULL)"),
+            [{"name": name} for name in names_list]
+        )
+        print(f"✅ Seeded {len(names_list)} names into database")
+
+
+def generate_tickets():
+    with engine.begin() as conn:
+        if conn.execute(text("SELECT EXISTS (SELECT 1 FROM tickets)")).scalar():
+            print("✅ Tickets already generated")
+            return
+
+        print("🎫 Generating tickets...")
+        db_names = [row[0] for row in conn.execute(text("SELECT name_text FROM names ORDER BY id"))]
+        if not db_names:
+            raise Exception("No names found in database!")
+
+        generated = pre_generate_tickets(db_names, count=min(len(db_names), 100))
+        conn.execute(
+            Ticket.__table__.insert(),
+            [{"grid": t["grid"], "is_assigned": False, "status": "active"} for t in generated]
+        )
+        print(f"✅ Generated {len(generated)} tickets")
+
+
+def reset_claim_lock():
+    with engine.begin() as conn:
+        # RESET LOCK ON RESTART (or create it on first boot)
+        conn.execute(text(
+            "INSERT INTO game_state (key, value) VALUES ('claim_lock', 'false') "
+            "ON CONFLICT (key) DO UPDATE SET value = 'false'"
+        ))
+    print("🔓 Claim lock reset to false")
+
+
+def warm_caches():
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    profiles = load_profiles()
+    sync_leaderboard_in_own_session()
+    print(f"✅ Caches warm ({len(profiles)} profiles, {len(leaderboard.remaining)} tickets on leaderboard)")
+
+
+startup_pipeline = StartupPipeline([
+    ("create_tables", create_tables),
+    ("seed_names", seed_names),
+    ("generate_tickets", generate_tickets),
+    ("reset_claim_lock", reset_claim_lock),
+    ("warm_caches", warm_caches),
+])
+
 
 @app.on_event("startup")
 async def startup_event():
+    leaderboard.attach(asyncio.get_running_loop())
+    startup_pipeline.start()
+
+
+@app.get("/ready")
+def ready():
+    """Readiness: startup pipeline finished and the database answers right now"""
+    status = startup_pipeline.status()
+    status["import_seconds"] = round(IMPORT_SECONDS, 3)
+
+    if not startup_pipeline.done:
+        return ORJSONResponse({"status": "starting", **status}, status_code=503)
+
     try:
-        # CREATE TABLES
-        Base.metadata.create_all(bind=engine)
-        print("✅ Database tables created")
-        
         with engine.connect() as conn:
-            # ⭐ SEED NAMES TABLE FIRST
-            names_count = conn.execute(text("SELECT COUNT(*) FROM names")).fetchone()[0]
-            if names_count == 0:
-                print("📝 Seeding names table...")
-                BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-                NAMES_FILE = os.path.join(BASE_DIR, "names.json")
-                
-                if os.path.exists(NAMES_FILE):
-                    with open(NAMES_FILE) as f:
-                        names_list = json.load(f)
-                    print(f"✅ Loaded {len(names_list)} names from names.json")
-                else:
-                    print("⚠️ names.json not found, using defaults")
-                    names_list = [f"Player_{i}" for i in range(1, 91)]
-                
-                # Insert names into database
-                for name in names_list:
-                    conn.execute(
-                        text("INSERT INTO names (name_text, is_picked, pick_order) VALUES (:name, false, NULL)"),
-                        {"name": name}
-                    )
-                conn.commit()
-                print(f"✅ Seeded {len(names_list)} names into database")
-            else:
-                print(f"✅ Found {names_count} names in database")
-            
-            # ⭐ THEN GENERATE TICKETS
-            tickets_count = conn.execute(text("SELECT COUNT(*) FROM tickets")).fetchone()[0]
-            if tickets_count == 0:
-                print("🎫 Generating tickets...")
-                
-                # Get names from database
-                result = conn.execute(text("SELECT name_text FROM names ORDER BY id"))
-                db_names = [row[0] for row in result]
-                
-                if not db_names:
-                    raise Exception("No names found in database!")
-                
-                generated = pre_generate_tickets(db_names, count=min(len(db_names), 100))
-                
-                for t in generated:
-                    conn.execute(
-                        Ticket.__table__.insert().values(
-                            grid=t["grid"],
-                            is_assigned=False,
-                            status="active"
-                        )
-                    )
-                conn.commit()
-                print(f"✅ Generated {len(generated)} tickets")
-            else:
-                print(f"✅ Found {tickets_count} existing tickets")
-            
-            # ⭐ INITIALIZE GAME STATE
-            game_state_count = conn.execute(text("SELECT COUNT(*) FROM game_state")).fetchone()[0]
-            if game_state_count == 0:
-                print("🎮 Initializing game state...")
-                conn.execute(
-                    text("INSERT INTO game_state (key, value) VALUES ('claim_lock', 'false')")
-                )
-                conn.commit()
-                print("✅ Game state initialized")
-            else:
-                # RESET LOCK ON RESTART
-                print("🔓 Resetting claim lock...")
-                conn.execute(
-                    text("UPDATE game_state SET value = 'false' WHERE key = 'claim_lock'")
-                )
-                conn.commit()
-                print("✅ Claim lock reset to false")
-                
+            conn.execute(text("SELECT 1"))
     except Exception as e:
-        print(f"❌ Startup error: {e}")
-        import traceback
-        traceback.print_exc()
+        return ORJSONResponse({"status": "unavailable", "error": str(e), **status}, status_code=503)
+
+    return {"status": "ready", **status}
+
 # -----------------------------
 # PRODUCTION ENTRYPOINT
 # -----------------------------
@@ -505,6 +726,9 @@ def validate_ticket(ticket, db):
     
     return True
 
+IMPORT_SECONDS = time.perf_counter() - IMPORT_STARTED
+print(f"⏱️ main imported in {IMPORT_SECONDS * 1000:.0f}ms")
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
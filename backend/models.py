@@ -38,4 +38,44 @@ class ClaimQueue(Base):
     status = Column(String(20), default='pending')
     verified_by = Column(String(50))
     verified_at = Column(TIMESTAMP)
-    is_valid = Column(Boolean, default=False)
\ No newline at end of file
+    is_valid = Column(Boolean, default=False)
+
+
+# -----------------------------
+# GAME HISTORY (filled by export.archive_game on reset)
+# -----------------------------
+
+class ArchivedGame(Base):
+    __tablename__ = 'archived_games'
+    id = Column(Integer, primary_key=True)
+    archived_at = Column(TIMESTAMP)
+    picks = Column(Integer)
+    players = Column(Integer)
+    winners = Column(Integer)
+
+class ArchivedPick(Base):
+    __tablename__ = 'archived_picks'
+    game_id = Column(Integer, ForeignKey('archived_games.id'), primary_key=True)
+    pick_order = Column(Integer, primary_key=True)
+    name_text = Column(String(100), nullable=False)
+    picked_at = Column(TIMESTAMP)
+
+class ArchivedRegistration(Base):
+    __tablename__ = 'archived_registrations'
+    game_id = Column(Integer, ForeignKey('archived_games.id'), primary_key=True)
+    ticket_id = Column(UUID(as_uuid=True), primary_key=True)
+    player_name = Column(String(100))
+    grid = Column(JSONB, nullable=False)
+    status = Column(String(20))
+    assigned_at = Column(TIMESTAMP)
+    claimed_at = Column(TIMESTAMP)
+
+class ArchivedClaim(Base):
+    __tablename__ = 'archived_claims'
+    game_id = Column(Integer, ForeignKey('archived_games.id'), primary_key=True)
+    claim_id = Column(Integer, primary_key=True)
+    ticket_id = Column(UUID(as_uuid=True))
+    status = Column(String(20))
+    is_valid = Column(Boolean)
+    claimed_at = Column(TIMESTAMP)
+    verified_at = Column(TIMESTAMP)
@@ -0,0 +1,154 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from fastapi.responses import ORJSONResponse
+
+
+def parse_budget(value: str):
+    """Parse a "rate/burst" budget string, e.g. "2/10" -> (2.0, 10.0)"""
+    rate, _, burst = value.partition("/")
+    rate = float(rate)
+    return rate, float(burst) if burst else max(rate, 1.0)
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """Take one token. Returns 0 on success, else seconds until one is available."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """In-process token buckets keyed by (route, client), capped at max_keys (LRU)"""
+
+    def __init__(self, budgets: dict, max_keys: int = 10000):
+        self.budgets = budgets
+        self.max_keys = max_keys
+        self.buckets = OrderedDict()
+        self.lock = threading.Lock()
+
+    def check(self, route: str, client: str) -> float:
+        """Returns 0 if the request is admitted, else the Retry-After in seconds."""
+        rate, burst = self.budgets[route]
+        now = time.monotonic()
+        key = (route, client)
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                if len(self.buckets) >= self.max_keys:
+                    self.buckets.popitem(last=False)
+                bucket = self.buckets[key] = TokenBucket(rate, burst, now)
+            else:
+                self.buckets.move_to_end(key)
+            return bucket.take(now)
+
+
+def client_ip(scope) -> str:
+    """Client address as seen by the platform proxy.
+
+    Only the right-most X-Forwarded-For entry is trusted: it is appended by the
+    proxy in front of us, while everything to its left is client-supplied.
+    """
+    for name, value in scope.get("headers", []):
+        if name == b"x-forwarded-for":
+            return value.decode("latin-1").rsplit(",", 1)[-1].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def rate_limit_key(scope, ticket_id, is_known_ticket, admin_token=None) -> str:
+    """Bucket key for a request: the admin, a known ticket, or else the client IP.
+
+    Unknown ticket ids fall back to the IP so rotating made-up ids can't mint
+    fresh buckets. The admin token ships in the frontend, so admin buckets are
+    per client too: anyone replaying it only drains their own.
+    """
+    if admin_token:
+        for name, value in scope.get("headers", []):
+            if name == b"authorization" and value.decode("latin-1") == admin_token:
+                return f"admin:{client_ip(scope)}"
+    if ticket_id and is_known_ticket(ticket_id):
+        return f"ticket:{ticket_id}"
+    return f"ip:{client_ip(scope)}"
+
+
+def too_busy(status_code: int, retry_after: float, message: str) -> ORJSONResponse:
+    return ORJSONResponse(
+        {"detail": message},
+        status_code=status_code,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+class AdmissionMiddleware:
+    """Sheds load before a request reaches any route (and so the database).
+
+    Requests to a rate-limited route are charged against a bucket picked by
+    rate_limit_key(), using the ticket id from the path or ``?ticket_id=``.
+    Everything else only counts against the global in-flight cap, except
+    ``uncapped`` paths (probes and long-lived streams), which skip it.
+    """
+
+    def __init__(self, app, limiter: RateLimiter, routes, max_inflight: int,
+                 is_known_ticket, admin_token=None, uncapped=()):
+        self.app = app
+        self.limiter = limiter
+        self.routes = tuple(routes)
+        self.max_inflight = max_inflight
+        self.is_known_ticket = is_known_ticket
+        self.admin_token = admin_token
+        self.uncapped = tuple(uncapped)
+        self.inflight = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        route = next((r for r in self.routes if path == r or path.startswith(r + "/")), None)
+        if route is not None:
+            client = rate_limit_key(scope, self._ticket_id(scope, path, route),
+                                    self.is_known_ticket, self.admin_token)
+            retry_after = self.limiter.check(route, client)
+            if retry_after:
+                await too_busy(429, retry_after, "Too many requests")(scope, receive, send)
+                return
+
+        if path in self.uncapped:
+            await self.app(scope, receive, send)
+            return
+
+        if self.inflight >= self.max_inflight:
+            await too_busy(503, 1, "Server busy")(scope, receive, send)
+            return
+
+        self.inflight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.inflight -= 1
+
+    def _ticket_id(self, scope, path: str, route: str):
+        tail = path[len(route):].strip("/")
+        if tail:
+            return tail
+        for param in scope.get("query_string", b"").decode("latin-1").split("&"):
+            key, _, value = param.partition("=")
+            if key == "ticket_id" and value:
+                return value
+        return None
@@ -0,0 +1,187 @@
+"""Monte Carlo simulator for sizing a game before an event.
+
+Generates tickets with tickets.generate_ticket, draws random pick orders and
+works out, for every game at once in NumPy, when each ticket fills up:
+
+    pip install -r requirements-tools.txt
+    python simulate.py --players 100 --games 100000
+    python simulate.py --players 300 --names 150 --seconds-per-pick 20 --json
+
+Reports picks-to-first-win, how often the first win is shared, and how many
+claims land on each pick right after the first win (what the claim pipeline
+and DB pool must absorb before the admin stops the game).
+"""
+import argparse
+import json
+import os
+import random
+import time
+
+import numpy as np
+
+from tickets import generate_ticket
+
+NAMES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "names.json")
+
+# Cells in the (games, tickets, 15) gather per batch; int16, so ~40 MB
+BATCH_ELEMENTS = 20_000_000
+
+# Tickets generated over a whole run by default (~1s of generate_ticket). Ticket
+# sets are regenerated every few games, independently of batching, so results
+# average over many draws instead of hinging on one.
+TICKET_BUDGET = 20_000
+
+
+def default_batch_size(players: int) -> int:
+    """Games per batch that keep the per-batch gather within BATCH_ELEMENTS"""
+    return max(1, BATCH_ELEMENTS // (players * 15))
+
+
+def default_ticket_sets(players: int, games: int) -> int:
+    """How many independent ticket sets to spread the games over"""
+    return max(1, min(games, TICKET_BUDGET // players))
+
+
+def ticket_matrix(num_names: int, num_tickets: int) -> np.ndarray:
+    """(tickets, 15) array of name indices, built with the real ticket generator"""
+    pool = list(range(num_names))
+    matrix = np.empty((num_tickets, 15), dtype=np.int16)
+    for i in range(num_tickets):
+        cells = [cell for row in generate_ticket(pool) for cell in row if cell is not None]
+        # The generator can place fewer than 15 names; repeating one doesn't change the max
+        matrix[i] = cells + cells[:1] * (15 - len(cells))
+    return matrix
+
+
+def simulate_batch(rng: np.random.Generator, tickets: np.ndarray, num_names: int, games: int) -> np.ndarray:
+    """Pick number (1-based) at which each ticket completes, shape (games, tickets)"""
+    # Ranking random keys gives each name's position in a uniformly random draw order
+    draw_position = rng.random((games, num_names)).argsort(axis=1).argsort(axis=1).astype(np.int16) + 1
+    return draw_position[:, tickets].max(axis=2)
+
+
+def run(num_names: int, players: int, games: int, batch_size: int = None, seed=None,
+        ticket_sets: int = None, window: int = 5) -> dict:
+    batch_size = batch_size or default_batch_size(players)
+    ticket_sets = min(games, ticket_sets or default_ticket_sets(players, games))
+    games_per_set = -(-games // ticket_sets)
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+
+    first_win = np.empty(games, dtype=np.int16)
+    first_win_winners = np.empty(games, dtype=np.int32)
+    max_burst = np.empty(games, dtype=np.int32)
+    claims_after_first_win = np.zeros(window, dtype=np.int64)
+
+    tickets, tickets_set = None, -1
+    done = 0
+    while done < games:
+        n = min(batch_size, games - done)
+        # Game g plays with ticket set g // games_per_set, whatever batch it lands in
+        parts = []
+        game = done
+        while game < done + n:
+            set_id = game // games_per_set
+            if set_id != tickets_set:
+                tickets, tickets_set = ticket_matrix(num_names, players), set_id
+            run_end = min(done + n, (set_id + 1) * games_per_set)
+            parts.append(simulate_batch(rng, tickets, num_names, run_end - game))
+            game = run_end
+        completion = np.concatenate(parts)
+
+        # completions[g, k] = tickets filling up exactly on pick k of game g
+        offsets = np.arange(n)[:, None] * (num_names + 1)
+        completions = np.bincount((completion + offsets).ravel(), minlength=n * (num_names + 1))
+        completions = completions.reshape(n, num_names + 1)
+
+        batch_first = completion.min(axis=1)
+        first_win[done:done + n] = batch_first
+        first_win_winners[done:done + n] = completions[np.arange(n), batch_first]
+
+        # Claims on the first win's pick and the (window - 1) picks after it
+        picks = batch_first[:, None] + np.arange(window)
+        burst = np.where(picks <= num_names,
+                         np.take_along_axis(completions, np.minimum(picks, num_names), axis=1), 0)
+        max_burst[done:done + n] = burst.max(axis=1)
+        claims_after_first_win += burst.sum(axis=0)
+        done += n
+
+    percentiles = [5, 25, 50, 75, 95, 99]
+    return {
+        "names": num_names,
+        "players": players,
+        "games": games,
+        "ticket_sets": ticket_sets,
+        "picks_to_first_win": {
+            "mean": round(float(first_win.mean()), 2),
+            **{f"p{p}": int(v) for p, v in zip(percentiles, np.percentile(first_win, percentiles))},
+            "min": int(first_win.min()),
+            "max": int(first_win.max()),
+        },
+        "simultaneous_first_win_probability": round(float((first_win_winners > 1).mean()), 4),
+        "first_win_winners_mean": round(float(first_win_winners.mean()), 3),
+        "max_claims_on_one_pick": {
+            "mean": round(float(max_burst.mean()), 2),
+            "p99": int(np.percentile(max_burst, 99)),
+            "max": int(max_burst.max()),
+        },
+        "expected_claims_after_first_win": [
+            round(float(c), 3) for c in claims_after_first_win / games
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=100, help="assigned tickets per game")
+    parser.add_argument("--names", type=int, default=None, help="names in the draw (default: names.json)")
+    parser.add_argument("--games", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help=f"games per batch (default: sized to {BATCH_ELEMENTS:,} cells per batch)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--ticket-sets", type=int, default=None,
+                        help=f"independent ticket sets to spread the games over "
+                             f"(default: {TICKET_BUDGET:,} tickets / players, at most one per game)")
+    parser.add_argument("--fixed-tickets", action="store_true",
+                        help="play every game with a single ticket set (same as --ticket-sets 1)")
+    parser.add_argument("--window", type=int, default=5,
+                        help="picks after the first win to count claim bursts over")
+    parser.add_argument("--seconds-per-pick", type=float, default=None,
+                        help="also report time to first win")
+    parser.add_argument("--json", action="store_true", help="print the raw report as JSON")
+    args = parser.parse_args()
+
+    num_names = args.names
+    if num_names is None:
+        with open(NAMES_FILE) as f:
+            num_names = len(json.load(f))
+
+    started = time.perf_counter()
+    report = run(num_names, args.players, args.games, args.batch_size, args.seed,
+                 ticket_sets=1 if args.fixed_tickets else args.ticket_sets, window=args.window)
+    report["runtime_seconds"] = round(time.perf_counter() - started, 2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    first = report["picks_to_first_win"]
+    burst = report["max_claims_on_one_pick"]
+    print(f"🎲 {report['games']:,} games | {num_names} names | {args.players} players "
+          f"| {report['ticket_sets']:,} ticket sets | {report['runtime_seconds']}s")
+    print(f"   Picks to first win: mean {first['mean']} | p5 {first['p5']} | p50 {first['p50']} "
+          f"| p95 {first['p95']} | range {first['min']}-{first['max']}")
+    if args.seconds_per_pick:
+        minutes = {k: first[k] * args.seconds_per_pick / 60 for k in ("p5", "p50", "p95")}
+        print(f"   Time to first win:  p5 {minutes['p5']:.1f}m | p50 {minutes['p50']:.1f}m "
+              f"| p95 {minutes['p95']:.1f}m")
+    print(f"   Shared first win:   {report['simultaneous_first_win_probability'] * 100:.2f}% of games "
+          f"(mean {report['first_win_winners_mean']} winners)")
+    print(f"   Max claims on one pick ({args.window} picks from first win): mean {burst['mean']} | p99 {burst['p99']} | max {burst['max']}")
+    print("   Expected claims per pick from the first win on:")
+    for offset, claims in enumerate(report["expected_claims_after_first_win"]):
+        print(f"      first win +{offset}: {claims}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import asyncio
+import time
+from collections import Counter
+
+from starlette.concurrency import run_in_threadpool
+
+
+class SingleFlight:
+    """Shares one blocking fetch between every concurrent caller asking for the same key.
+
+    The fetch runs in the threadpool, so waiters stay on the event loop instead of
+    each running their own query. Results are reused for ``ttl`` seconds, or until
+    invalidate() is called after a write on this worker; a write on another worker
+    is picked up once the ttl runs out.
+    """
+
+    def __init__(self, ttl: float = 0.0):
+        self.ttl = ttl
+        self.generation = 0
+        self.inflight = {}
+        self.results = {}
+        self.stats = Counter()
+
+    async def do(self, key, fetch):
+        full_key = (key, self.generation)
+        cached = self.results.get(full_key)
+        if cached is not None and cached[0] > time.monotonic():
+            self.stats[f"{key}.cached"] += 1
+            return cached[1]
+
+        task = self.inflight.get(full_key)
+        if task is None:
+            self.stats[f"{key}.executed"] += 1
+            task = asyncio.ensure_future(run_in_threadpool(fetch))
+            self.inflight[full_key] = task
+            task.add_done_callback(lambda t: self._finish(full_key, t))
+        else:
+            self.stats[f"{key}.coalesced"] += 1
+        # Shielded so one disconnecting caller doesn't cancel the fetch for the rest
+        return await asyncio.shield(task)
+
+    def _finish(self, full_key, task):
+        self.inflight.pop(full_key, None)
+        if self.ttl and not task.cancelled() and task.exception() is None \
+                and full_key[1] == self.generation:
+            self.results[full_key] = (time.monotonic() + self.ttl, task.result())
+
+    def invalidate(self):
+        """Call after a write so later readers don't get a result fetched before it"""
+        self.generation += 1
+        self.results.clear()
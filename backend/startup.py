@@ -0,0 +1,61 @@
+import threading
+import time
+import traceback
+
+
+class StartupPipeline:
+    """Runs slow boot steps on a background thread so the app can serve liveness immediately.
+
+    Steps must be idempotent: a failing step is retried with backoff (e.g. while
+    the database is still coming up) until it succeeds.
+    """
+
+    def __init__(self, steps, max_backoff: float = 10.0):
+        self.steps = steps
+        self.max_backoff = max_backoff
+        self.completed = []
+        self.current = None
+        self.last_error = None
+        self.started_at = None
+        self.finished_at = None
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        threading.Thread(target=self._run, name="startup-pipeline", daemon=True).start()
+
+    @property
+    def done(self) -> bool:
+        return self.finished_at is not None
+
+    def _run(self):
+        for name, step in self.steps:
+            self.current = name
+            began = time.perf_counter()
+            backoff = 0.5
+            while True:
+                try:
+                    step()
+                    break
+                except Exception as e:
+                    self.last_error = f"{name}: {e}"
+                    print(f"❌ Startup step '{name}' failed, retrying in {backoff:.1f}s: {e}")
+                    if backoff == 0.5:
+                        traceback.print_exc()
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, self.max_backoff)
+            self.completed.append({"step": name, "seconds": round(time.perf_counter() - began, 3)})
+        self.current = None
+        self.last_error = None
+        self.finished_at = time.perf_counter()
+        print(f"✅ Startup pipeline finished in {self.finished_at - self.started_at:.2f}s")
+
+    def status(self) -> dict:
+        end = self.finished_at or time.perf_counter()
+        return {
+            "done": self.done,
+            "current_step": self.current,
+            "completed_steps": list(self.completed),
+            "pending_steps": [name for name, _ in self.steps[len(self.completed):]],
+            "last_error": self.last_error,
+            "elapsed_seconds": round(end - self.started_at, 3) if self.started_at else 0,
+        }
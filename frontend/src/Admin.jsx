@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react'
+import React, { useState, useEffect, useRef } from 'react'
 
 export default function Admin({ apiUrl }) {
   const [authenticated, setAuthenticated] = useState(false)
@@ -12,11 +12,15 @@ export default function Admin({ apiUrl }) {
   const [revealedName, setRevealedName] = useState(null)
   const [profileData, setProfileData] = useState(null)
   const [revealed, setRevealed] = useState(false)
+  const [leaderboard, setLeaderboard] = useState(null)
+  // Set from Retry-After when the server sheds our polls; polling pauses until then
+  const pausedUntil = useRef(0)
 
   useEffect(() => {
     if (authenticated) {
       loadQrCode()
       const interval = setInterval(() => {
+        if (Date.now() < pausedUntil.current) return
         loadGameStatus()
         loadClaims()
       }, 1000)
@@ -24,6 +28,14 @@ export default function Admin({ apiUrl }) {
     }
   }, [authenticated])
 
+  // Near-win leaderboard is pushed by the server whenever a pick or registration changes it
+  useEffect(() => {
+    if (!authenticated) return
+    const source = new EventSource(`${apiUrl}/api/admin/leaderboard/stream?top=10`)
+    source.addEventListener('leaderboard', (e) => setLeaderboard(JSON.parse(e.data)))
+    return () => source.close()
+  }, [authenticated])
+
   const loadQrCode = async () => {
     try {
       const res = await fetch(`${apiUrl}/api/admin/qr-code`)
@@ -52,9 +64,21 @@ export default function Admin({ apiUrl }) {
     }
   }
 
+  // True (and polling paused) if the server answered 429/503
+  const throttled = (res) => {
+    if (res.status !== 429 && res.status !== 503) return false
+    const retryAfter = parseInt(res.headers.get('Retry-After'), 10) || 5
+    pausedUntil.current = Date.now() + retryAfter * 1000
+    return true
+  }
+
   const loadGameStatus = async () => {
     try {
-      const res = await fetch(`${apiUrl}/api/game-status`)
+      // The admin token gives the console its own rate-limit bucket instead of the venue IP's
+      const res = await fetch(`${apiUrl}/api/game-status`, {
+        headers: { Authorization: 'admin_authenticated' }
+      })
+      if (throttled(res) || !res.ok) return
       const data = await res.json()
       setGameStatus(data)
     } catch (err) {
@@ -65,6 +89,7 @@ export default function Admin({ apiUrl }) {
   const loadClaims = async () => {
     try {
       const res = await fetch(`${apiUrl}/api/admin/claims`)
+      if (throttled(res) || !res.ok) return
       const data = await res.json()
       setClaims(data)
     } catch (err) {
@@ -192,10 +217,25 @@ export default function Admin({ apiUrl }) {
           </div>
         )}
 
+        {leaderboard?.leaders.some(l => l.remaining <= 2) && (
+          <div className="bg-gray-800 rounded-lg p-6 mb-6">
+            <h2 className="text-xl font-bold mb-4">
+              Near Wins: {leaderboard.counts['1'] || 0} need 1, {leaderboard.counts['2'] || 0} need 2
+            </h2>
+            <div className="grid grid-cols-2 md:grid-cols-4 gap-2">
+              {leaderboard.leaders.filter(l => l.remaining <= 2).map(l => (
+                <div key={l.ticket_id} className={`${l.remaining === 0 ? 'bg-yellow-600' : l.remaining === 1 ? 'bg-orange-600' : 'bg-gray-700'} p-3 rounded text-center`}>
+                  {l.player_name} ({l.remaining})
+                </div>
+              ))}
+            </div>
+          </div>
+        )}
+
         <div className="bg-gray-800 rounded-lg p-6">
           <h2 className="text-xl font-bold mb-4">Called Names</h2>
           <div className="grid grid-cols-2 md:grid-cols-4 gap-2">
-            {gameStatus?.picked_names.map((n, i) => (
+            {gameStatus?.picked_names?.map((n, i) => (
               <div key={i} className="bg-green-600 p-3 rounded text-center">
                 {n.name}
               </div>
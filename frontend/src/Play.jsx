@@ -13,16 +13,42 @@ export default function Play({ apiUrl, ticketId }) {
   }, [ticketId])
 
   useEffect(() => {
-    const interval = setInterval(() => {
-      loadGameStatus()
-    }, 2000 + Math.random() * 2000)
-    return () => clearInterval(interval)
+    let timer
+    let cancelled = false
+    const poll = async () => {
+      const retryAfter = await loadGameStatus()
+      // Unmounted while the request was in flight: don't schedule another poll
+      if (cancelled) return
+      // Back off for as long as the server asks when it throttles us
+      timer = setTimeout(poll, retryAfter ? retryAfter * 1000 : 2000 + Math.random() * 2000)
+    }
+    timer = setTimeout(poll, 2000 + Math.random() * 2000)
+    return () => {
+      cancelled = true
+      clearTimeout(timer)
+    }
   }, [])
+
+  // Seconds to wait before retrying a 429/503, or 0 if the request went through
+  const retryAfterSeconds = (res) =>
+    res.status === 429 || res.status === 503
+      ? parseInt(res.headers.get('Retry-After'), 10) || 5
+      : 0
   
 
   const loadTicket = async () => {
     try {
       const res = await fetch(`${apiUrl}/api/ticket/${ticketId}`)
+      const retryAfter = retryAfterSeconds(res)
+      if (retryAfter) {
+        // Throttled or shed: keep showing Loading... and try again when the server says
+        setTimeout(loadTicket, retryAfter * 1000)
+        return
+      }
+      if (!res.ok) {
+        console.error('Load ticket error:', res.status)
+        return
+      }
       const data = await res.json()
       setTicket(data)
     } catch (err) {
@@ -32,13 +58,16 @@ export default function Play({ apiUrl, ticketId }) {
 
   const loadGameStatus = async () => {
     try {
-      const res = await fetch(`${apiUrl}/api/game-status`)
+      const res = await fetch(`${apiUrl}/api/game-status?ticket_id=${ticketId}`)
+      const retryAfter = retryAfterSeconds(res)
+      if (retryAfter) return retryAfter
       const data = await res.json()
       console.log('Game Status Response:', data) // DEBUG LOG
       setGameStatus(data)
     } catch (err) {
       console.error('Load game status error:', err)
     }
+    return 0
   }
   
   const handleLogout = () => {
@@ -71,6 +100,11 @@ export default function Play({ apiUrl, ticketId }) {
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ ticket_id: ticketId })
       })
+      const retryAfter = retryAfterSeconds(res)
+      if (retryAfter) {
+        alert(`Too many attempts, try again in ${retryAfter}s`)
+        return
+      }
       const data = await res.json()
       if (data.success) {
         alert('Claim submitted! Waiting for verification...')
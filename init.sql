@@ -40,4 +40,43 @@ CREATE INDEX idx_claims_pending ON claim_queue(status, claimed_at);
 INSERT INTO game_state (key, value) VALUES 
   ('game_started', 'false'),
   ('claim_lock', 'false')
-ON CONFLICT (key) DO NOTHING;
\ No newline at end of file
+ON CONFLICT (key) DO NOTHING;
+
+-- Finished games, moved out of the live tables by reset-game
+CREATE TABLE IF NOT EXISTS archived_games (
+  id SERIAL PRIMARY KEY,
+  archived_at TIMESTAMP,
+  picks INTEGER,
+  players INTEGER,
+  winners INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS archived_picks (
+  game_id INTEGER REFERENCES archived_games(id),
+  pick_order INTEGER,
+  name_text VARCHAR(100) NOT NULL,
+  picked_at TIMESTAMP,
+  PRIMARY KEY (game_id, pick_order)
+);
+
+CREATE TABLE IF NOT EXISTS archived_registrations (
+  game_id INTEGER REFERENCES archived_games(id),
+  ticket_id UUID,
+  player_name VARCHAR(100),
+  grid JSONB NOT NULL,
+  status VARCHAR(20),
+  assigned_at TIMESTAMP,
+  claimed_at TIMESTAMP,
+  PRIMARY KEY (game_id, ticket_id)
+);
+
+CREATE TABLE IF NOT EXISTS archived_claims (
+  game_id INTEGER REFERENCES archived_games(id),
+  claim_id INTEGER,
+  ticket_id UUID,
+  status VARCHAR(20),
+  is_valid BOOLEAN,
+  claimed_at TIMESTAMP,
+  verified_at TIMESTAMP,
+  PRIMARY KEY (game_id, claim_id)
+);
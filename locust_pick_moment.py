@@ -0,0 +1,97 @@
+from locust import HttpUser, task, between, constant, events
+import gevent
+from gevent.event import Event
+import uuid
+import random
+
+# Every player's next poll lands right after a pick. Run at a few sizes and
+# compare the "DB queries per pick" line, it should stay flat:
+#   locust -f locust_pick_moment.py --host http://localhost:8000 -u 51 -r 51 --headless -t 2m
+#   locust -f locust_pick_moment.py --host http://localhost:8000 -u 201 -r 100 --headless -t 2m
+# Needs a fresh game (reset first) with enough tickets for every player.
+
+PICK_INTERVAL = 10
+ADMIN_HEADERS = {"Authorization": "admin_authenticated"}
+
+pick_happened = Event()
+samples = []
+
+
+def shared_read_counters(client):
+    response = client.get("/api/debug/shared-reads", name="debug: Shared Reads")
+    return response.json() if response.status_code == 200 else None
+
+
+class PickAdmin(HttpUser):
+    """Calls a name every PICK_INTERVAL seconds and samples the DB query counter"""
+    fixed_count = 1
+    wait_time = constant(1)
+
+    def on_start(self):
+        self.before = shared_read_counters(self.client)
+
+    @task
+    def pick(self):
+        global pick_happened
+        response = self.client.post("/api/admin/pick-name", headers=ADMIN_HEADERS, name="admin: Pick Name")
+        if response.status_code != 200:
+            return
+        # Release every waiting player at once, then arm a fresh event for the next pick
+        event, pick_happened = pick_happened, Event()
+        event.set()
+
+        # Let the herd finish before reading the counters
+        gevent.sleep(PICK_INTERVAL - 1)
+        after = shared_read_counters(self.client)
+        if self.before and after:
+            samples.append({
+                "db_queries": after["db_queries"] - self.before["db_queries"],
+                "game_status": {
+                    kind: after["reads"].get(f"game_status.{kind}", 0)
+                    - self.before["reads"].get(f"game_status.{kind}", 0)
+                    for kind in ("executed", "coalesced", "cached")
+                },
+            })
+        self.before = after
+
+
+class PollingPlayer(HttpUser):
+    """Waits for a pick, then polls game status like Play.jsx does"""
+    wait_time = between(0, 0.1)
+
+    def on_start(self):
+        response = self.client.post("/api/register", json={
+            "player_name": f"Herd_{uuid.uuid4().hex[:8]}"
+        }, timeout=10, name="player: Registration")
+        self.ticket_id = response.json().get("ticket_id") if response.status_code == 200 else None
+
+    @task
+    def poll_after_pick(self):
+        if not self.ticket_id:
+            return
+        pick_happened.wait(timeout=PICK_INTERVAL * 2)
+        # Browsers don't all fire on the same millisecond
+        gevent.sleep(random.random() * 0.2)
+        self.client.get("/api/game-status", params={"ticket_id": self.ticket_id},
+                        name="player: Poll Game Status")
+        # Wait for the next pick rather than polling the same one again
+        gevent.sleep(1)
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    players = environment.runner.user_count - 1 if environment.runner else "?"
+    print("\n" + "=" * 80)
+    print(f"⚡ PICK MOMENT RESULTS ({players} players)")
+    print("=" * 80)
+    if not samples:
+        print("   No picks sampled (is /api/debug/shared-reads reachable?)")
+    for i, sample in enumerate(samples, 1):
+        gs = sample["game_status"]
+        print(f"   pick {i}: {sample['db_queries']} DB queries | game_status executed {gs['executed']}, "
+              f"coalesced {gs['coalesced']}, cached {gs['cached']}")
+    if samples:
+        mean = sum(s["db_queries"] for s in samples) / len(samples)
+        print("-" * 80)
+        print(f"   DB queries per pick: {mean:.1f} (includes the pick itself and the counter reads)")
+    print("=" * 80 + "\n")
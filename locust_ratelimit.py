@@ -0,0 +1,163 @@
+from locust import HttpUser, LoadTestShape, task, between, constant, events
+import os
+import time
+import uuid
+
+# Two phases in one run, so the comparison uses the same server and data:
+#   1. baseline: PLAYERS legitimate players only
+#   2. abuse:    the same players plus ABUSERS tight-loop clients
+# The verdict compares the legitimate p95 between the two phases.
+#   PLAYERS=100 ABUSERS=10 locust -f locust_ratelimit.py --host http://localhost:8000 --headless
+PLAYERS = int(os.getenv("PLAYERS", 100))
+ABUSERS = int(os.getenv("ABUSERS", 10))
+PHASE_SECONDS = int(os.getenv("PHASE_SECONDS", 90))
+WARMUP_SECONDS = 15
+# Allowed p95 regression from baseline to abuse phase
+P95_TOLERANCE = 1.2
+P95_SLACK_MS = 20
+
+phase = {"name": "baseline", "started": time.monotonic()}
+legit_times = {"baseline": [], "abuse": []}
+
+
+def register(user, label):
+    response = user.client.post("/api/register", json={
+        "player_name": f"{label}_{uuid.uuid4().hex[:8]}"
+    }, timeout=10, name=f"{label}: Registration")
+    user.ticket_id = response.json().get("ticket_id") if response.status_code == 200 else None
+
+
+class LegitPlayer(HttpUser):
+    """Polls like Play.jsx does and never expects to be throttled"""
+    weight = PLAYERS
+    wait_time = between(2, 4)
+
+    def on_start(self):
+        register(self, "legit")
+
+    @task(10)
+    def poll_game_status(self):
+        if not self.ticket_id:
+            return
+        with self.client.get("/api/game-status", params={"ticket_id": self.ticket_id},
+                             name="legit: Poll Game Status", catch_response=True) as response:
+            if response.status_code == 429:
+                response.failure("Legitimate player was throttled")
+
+    @task(3)
+    def get_ticket_data(self):
+        if not self.ticket_id:
+            return
+        with self.client.get(f"/api/ticket/{self.ticket_id}",
+                             name="legit: Get Ticket", catch_response=True) as response:
+            if response.status_code == 429:
+                response.failure("Legitimate player was throttled")
+
+
+class AbusivePlayer(HttpUser):
+    """A stuck phone or script: polls and claims in a tight loop"""
+    weight = ABUSERS
+    wait_time = constant(0)
+
+    def on_start(self):
+        register(self, "abuse")
+
+    @task(5)
+    def hammer_game_status(self):
+        if not self.ticket_id:
+            return
+        self.throttled_request("get", "/api/game-status", "abuse: Poll Game Status",
+                               params={"ticket_id": self.ticket_id})
+
+    @task(1)
+    def spam_claim(self):
+        if not self.ticket_id:
+            return
+        self.throttled_request("post", "/api/claim", "abuse: Claim Spam",
+                               json={"ticket_id": self.ticket_id})
+
+    def throttled_request(self, method, path, name, **kwargs):
+        # 429 is the expected outcome here, so count it rather than fail on it
+        with self.client.request(method, path, name=name, catch_response=True, **kwargs) as response:
+            if response.status_code in (200, 429):
+                response.success()
+            if response.status_code == 429:
+                throttled[name] = throttled.get(name, 0) + 1
+
+
+throttled = {}
+
+
+class BaselineThenAbuse(LoadTestShape):
+    """Legit players alone for PHASE_SECONDS, then abusers join for another PHASE_SECONDS"""
+
+    def tick(self):
+        run_time = self.get_run_time()
+        if run_time < PHASE_SECONDS:
+            return PLAYERS, PLAYERS, [LegitPlayer]
+        if run_time < 2 * PHASE_SECONDS:
+            if phase["name"] != "abuse":
+                phase.update(name="abuse", started=time.monotonic())
+            return PLAYERS + ABUSERS, PLAYERS + ABUSERS, [LegitPlayer, AbusivePlayer]
+        return None
+
+
+@events.request.add_listener
+def on_request(request_type, name, response_time, exception, context=None, **kwargs):
+    # Skip registrations and the ramp-up at the start of each phase
+    if not name.startswith("legit") or name.endswith("Registration") or exception:
+        return
+    if time.monotonic() - phase["started"] >= WARMUP_SECONDS:
+        legit_times[phase["name"]].append(response_time)
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    phase.update(name="baseline", started=time.monotonic())
+
+
+def p95(times):
+    ordered = sorted(times)
+    return ordered[int(len(ordered) * 0.95)] if ordered else None
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    stats = environment.stats
+    print("\n" + "=" * 80)
+    print("🚦 RATE LIMIT TEST RESULTS")
+    print("=" * 80)
+
+    passed = True
+    baseline, abused = p95(legit_times["baseline"]), p95(legit_times["abuse"])
+    if baseline is None or abused is None:
+        print("   Not enough legitimate samples in both phases (run the full shape)")
+        passed = False
+    else:
+        print(f"   Legit p95 baseline: {baseline:.0f}ms ({len(legit_times['baseline']):,} reqs)")
+        print(f"   Legit p95 with abusers: {abused:.0f}ms ({len(legit_times['abuse']):,} reqs)")
+        if abused > baseline * P95_TOLERANCE + P95_SLACK_MS:
+            passed = False
+
+    for name, entry in stats.entries.items():
+        name = name[0] if isinstance(name, tuple) else name
+        if not entry.num_requests:
+            continue
+        if name.startswith("legit"):
+            print(f"   {name}: {entry.num_requests:,} reqs | failures {entry.num_failures}")
+            if entry.num_failures:
+                passed = False
+        elif name.startswith("abuse") and not name.endswith("Registration"):
+            rejected = throttled.get(name, 0)
+            share = rejected / entry.num_requests * 100
+            print(f"   {name}: {entry.num_requests:,} reqs | throttled {rejected:,} ({share:.1f}%)")
+            if share < 50:
+                passed = False
+
+    print("-" * 80)
+    if passed:
+        print("🎉 Legitimate players unaffected, abusive clients throttled")
+    else:
+        print(f"⚠️  Legit p95 rose more than {P95_TOLERANCE}x + {P95_SLACK_MS}ms, "
+              "legit requests failed, or abusers were not throttled")
+    print("=" * 80 + "\n")
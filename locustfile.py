@@ -42,7 +42,8 @@ class BingoPlayer(HttpUser):
         if not self.ticket_id:
             return
             
-        self.client.get("/api/game-status", name="2. Poll Game Status")
+        self.client.get("/api/game-status", params={"ticket_id": self.ticket_id},
+                        name="2. Poll Game Status")
     
     @task(3)
     def get_ticket_data(self):